@@ -6,8 +6,10 @@ DOJ press releases and categorizing charges.
 
 from .analyzer import CaseAnalyzer
 from .categorizer import ChargeCategorizer
+from .keyword_matcher import KeywordMatcher
 
 __all__ = [
     "CaseAnalyzer",
     "ChargeCategorizer",
+    "KeywordMatcher",
 ]
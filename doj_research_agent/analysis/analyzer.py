@@ -2,11 +2,14 @@
 
 import re
 import json
-from typing import List, Optional
+import asyncio
+import hashlib
+from typing import Any, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from datetime import datetime
 from ..core.models import CaseInfo, CaseType, Disposition, CaseFraudInfo
 from .categorizer import ChargeCategorizer
+from .keyword_matcher import KeywordMatcher
 from ..core.utils import setup_logger
 import os
 from ..core.constants import FRAUD_KEYWORDS
@@ -18,6 +21,212 @@ except ImportError:
 
 logger = setup_logger(__name__)
 
+# Every fraud keyword from FRAUD_KEYWORDS, compiled once for single-pass content scans
+FRAUD_KEYWORD_MATCHER = KeywordMatcher.from_keywords(
+    keyword
+    for keywords in FRAUD_KEYWORDS.values() if isinstance(keywords, (list, set))
+    for keyword in keywords
+)
+
+# Charge category values that mark a case as fraud on their own
+FRAUD_CATEGORY_VALUES = frozenset({
+    'financial_fraud', 'health_care_fraud', 'disaster_fraud',
+    'consumer_protection', 'cybercrime', 'false_claims_act',
+    'public_corruption', 'tax', 'immigration', 'intellectual_property'
+})
+
+# Improved charge patterns, compiled once and applied in order
+CHARGE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'charged with ([^.]+)',
+    r'indicted (?:on|for) ([^.]+)',
+    r'convicted of ([^.]+)',
+    r'pleaded guilty to ([^.]+)',
+    r'pled guilty to ([^.]+)',
+    r'count(?:s)? of ([^.]+)',
+    r'violation of ([^.]+)',
+    r'sentenced for ([^.]+)',
+    r'guilty of ([^.]+)',
+    r'for (?:committing|conspiring to commit) ([^.]+)',
+    r'on charges? of ([^.]+)',
+))
+CHARGE_SPLIT_RE = re.compile(r',|;| and | or |\n|\u2022|- ')
+INDICTMENT_RE = re.compile(r'(Indictment\s*(No\.|Number)?\s*[:#]?\s*[A-Za-z0-9\-]+)', re.IGNORECASE)
+TRAILING_PUNCTUATION_RE = re.compile(r'[,;:]$')
+HAS_LETTER_RE = re.compile(r'[a-zA-Z]')
+
+# Money laundering specific keywords (do NOT include these in fraud_keywords)
+LAUNDERING_KEYWORD_MATCHER = KeywordMatcher.from_keywords({
+    'money laundering', 'laundering', 'laundered', 'launder',
+    'cleaning money', 'proceeds of crime', 'illicit funds',
+    'placement', 'layering', 'integration',
+    'smurfing', 'structuring', 'shell company',
+    'front company', 'offshore account', 'hawala',
+    'bulk cash', 'wire transfer', 'bank secrecy',
+    'anti-money laundering', 'aml', 'financial crimes enforcement network',
+    'finCEN', 'suspicious activity report', 'sar',
+    'currency transaction report', 'ctr',
+    'unexplained wealth', 'concealment of proceeds',
+    'illegal proceeds', 'dirty money', 'clean money',
+})
+
+GPT4O_SYSTEM_PROMPT = "You are a DOJ legal research assistant specializing in fraud case identification and legal data extraction. Always apply legal standards and context when determining fraud."
+
+# Shared by the single-case and batched GPT-4o requests; FRAUD_KEYWORDS is constant so this is built once
+GPT4O_INSTRUCTIONS = f"""
+You are a DOJ fraud legal researcher. Your primary task is to determine, with legal precision, whether the following DOJ press release describes a fraud case. Focus on legal standards, context, and the substance of the charges or conduct described. Ignore generic or irrelevant mentions of 'fraud' (e.g., in disclaimers, unrelated news, or boilerplate language). Only mark fraud_flag as true if the facts, charges, or context clearly indicate a fraud, scam, scheme, or deceptive practice as defined by law.
+
+Extract the following fields as a JSON object (fraud_flag must be the first field):
+- fraud_flag: Boolean, true if this is a fraud case, false otherwise (this is the key field)
+- fraud_type: If fraud_flag is true, categorize the fraud type from: financial_fraud, healthcare_fraud, disaster_fraud, consumer_fraud, government_fraud, business_fraud, immigration_fraud, intellectual_property_fraud, general_fraud, or null if not fraud
+- fraud_evidence: If fraud_flag is true, provide a brief snippet of evidence (string), otherwise null
+- fraud_rationale: 1-2 sentences explaining why you classified this as fraud or not, referencing legal context or charge language
+- title: The title of the press release
+- date: The date of the press release
+- charges: List all charges mentioned (array of strings)
+- indictment_number: Indictment number if present, otherwise null
+- charge_count: Number of charges found
+
+FRAUD DETECTION GUIDELINES:
+Use these keywords to identify fraud cases:
+{json.dumps(FRAUD_KEYWORDS, separators=(',', ':'))}
+
+A case should be marked as fraud if it contains any of these keywords in a legally relevant context, or involves deceptive practices, schemes, or false representations as defined by law. Do not mark as fraud for generic mentions or unrelated uses of the word.
+
+LOGICAL CONSISTENCY RULES:
+- If you set fraud_type or fraud_evidence, you MUST set fraud_flag to true.
+- If fraud_flag is false, fraud_type, fraud_evidence, and fraud_rationale must all be null.
+- If fraud_type is not null or fraud_evidence is not null, fraud_flag must be true.
+- If fraud_flag is false, fraud_type and fraud_evidence must be null.
+- All fields must be logically consistent.
+"""
+
+# The long, unchanging guide goes first so OpenAI's automatic prompt caching can reuse it;
+# only the press release text in the user message varies between requests
+GPT4O_SYSTEM_MESSAGE = f"{GPT4O_SYSTEM_PROMPT}\n{GPT4O_INSTRUCTIONS}"
+
+GPT4O_FRAUD_TYPES = [
+    "financial_fraud", "healthcare_fraud", "disaster_fraud", "consumer_fraud", "government_fraud",
+    "business_fraud", "immigration_fraud", "intellectual_property_fraud", "general_fraud",
+]
+
+# Strict structured-output schema for one case, with the fields in prompt order
+GPT4O_CASE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "fraud_flag": {"type": "boolean"},
+        "fraud_type": {"type": ["string", "null"], "enum": GPT4O_FRAUD_TYPES + [None]},
+        "fraud_evidence": {"type": ["string", "null"]},
+        "fraud_rationale": {"type": ["string", "null"]},
+        "title": {"type": "string"},
+        "date": {"type": "string"},
+        "charges": {"type": "array", "items": {"type": "string"}},
+        "indictment_number": {"type": ["string", "null"]},
+        "charge_count": {"type": "integer"},
+    },
+    "required": [
+        "fraud_flag", "fraud_type", "fraud_evidence", "fraud_rationale", "title", "date",
+        "charges", "indictment_number", "charge_count",
+    ],
+    "additionalProperties": False,
+}
+
+GPT4O_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "doj_case", "schema": GPT4O_CASE_SCHEMA, "strict": True},
+}
+
+# Batched requests wrap the per-case objects, each tagged with its case number, in {"cases": [...]}
+GPT4O_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "doj_cases",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "cases": {
+                    "type": "array",
+                    "items": {
+                        **GPT4O_CASE_SCHEMA,
+                        "properties": {"idx": {"type": "integer"}, **GPT4O_CASE_SCHEMA["properties"]},
+                        "required": ["idx"] + GPT4O_CASE_SCHEMA["required"],
+                    },
+                },
+            },
+            "required": ["cases"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+
+# GPT-4o replies that parse and match the schema are cached on disk by request hash so
+# identical reruns skip the API;
+# set OPENAI_CACHE_BYPASS=1 to always call the API (fresh replies still refresh the cache)
+GPT4O_CACHE_DIR = os.path.expanduser(os.getenv("GPT4O_CACHE_DIR", "~/.cache/doj_gpt4o"))
+
+
+def _gpt4o_cache_key(prompt: str, max_tokens: int,
+                     response_format: dict = GPT4O_RESPONSE_FORMAT) -> str:
+    """Hash everything that determines a GPT-4o reply into a cache key."""
+    request = json.dumps(["gpt-4o", 0.1, max_tokens, response_format, GPT4O_SYSTEM_MESSAGE, prompt])
+    return hashlib.blake2b(request.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _matches_schema(value: Any, schema: dict) -> bool:
+    """Check a parsed JSON value's object/array structure and required fields against a schema."""
+    if schema.get("type") == "object":
+        if not isinstance(value, dict) or any(key not in value for key in schema.get("required", ())):
+            return False
+        return all(_matches_schema(value[key], sub_schema)
+                   for key, sub_schema in schema.get("properties", {}).items() if key in value)
+    if schema.get("type") == "array":
+        return isinstance(value, list) and all(_matches_schema(item, schema.get("items", {})) for item in value)
+    return True
+
+
+def _gpt4o_reply_is_valid(content: str, response_format: dict) -> bool:
+    """Return True if a reply parses as JSON and matches the response format's schema."""
+    try:
+        parsed = json.loads(CaseAnalyzer._strip_code_fence(content))
+    except (TypeError, ValueError):
+        return False
+    return _matches_schema(parsed, response_format.get("json_schema", {}).get("schema", {}))
+
+
+def _gpt4o_cache_get(prompt: str, max_tokens: int,
+                     response_format: dict = GPT4O_RESPONSE_FORMAT) -> Tuple[str, Optional[str]]:
+    """
+    Look up a GPT-4o reply in the disk cache.
+    
+    Returns:
+        The cache key, and the cached content or None on a miss, when bypassed, or when
+        the stored reply no longer validates
+    """
+    key = _gpt4o_cache_key(prompt, max_tokens, response_format)
+    if os.getenv("OPENAI_CACHE_BYPASS"):
+        return key, None
+    try:
+        with open(os.path.join(GPT4O_CACHE_DIR, f"{key}.json"), encoding="utf-8") as f:
+            content = json.load(f)["content"]
+    except (OSError, ValueError, KeyError):
+        return key, None
+    return key, content if _gpt4o_reply_is_valid(content, response_format) else None
+
+
+def _gpt4o_cache_put(key: str, content: str, response_format: dict = GPT4O_RESPONSE_FORMAT) -> None:
+    """Store message content for a key; truncated or malformed replies are not cached."""
+    if not _gpt4o_reply_is_valid(content, response_format):
+        return
+    path = os.path.join(GPT4O_CACHE_DIR, f"{key}.json")
+    try:
+        os.makedirs(GPT4O_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"content": content}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write GPT-4o cache entry {key}: {e}")
+
 
 class CaseAnalyzer:
     """Analyzer for extracting case information from press releases."""
@@ -26,34 +235,19 @@ class CaseAnalyzer:
         """Initialize analyzer."""
         self.categorizer = ChargeCategorizer()
     
-    def _is_fraud_case(self, charge_categories, content: str) -> CaseFraudInfo:
+    def _is_fraud_case(self, charge_categories, content: str, content_lower: Optional[str] = None) -> CaseFraudInfo:
         """
         Determine if a case is fraud based on charge categories or content.
-        Returns a CaseFraudInfo object.
+        Returns a CaseFraudInfo object. Pass content_lower when the caller already has it.
         """
-        # Use FRAUD_KEYWORDS from constants.py for all fraud keyword checks
-        fraud_keywords = set()
-        for v in FRAUD_KEYWORDS.values():
-            if isinstance(v, list):
-                fraud_keywords.update(v)
-            elif isinstance(v, set):
-                fraud_keywords.update(list(v))
-        
         # Check charge categories for fraud-related categories
-        fraud_categories = {
-            'financial_fraud', 'health_care_fraud', 'disaster_fraud', 
-            'consumer_protection', 'cybercrime', 'false_claims_act',
-            'public_corruption', 'tax', 'immigration', 'intellectual_property'
-        }
-        
-        category_fraud = any(cat.value in fraud_categories for cat in charge_categories)
+        category_fraud = any(cat.value in FRAUD_CATEGORY_VALUES for cat in charge_categories)
         
-        # Check content for fraud keywords
-        content_lower = content.lower()
-        found_keywords = []
-        for keyword in fraud_keywords:
-            if keyword in content_lower:
-                found_keywords.append(keyword)
+        # Check content for fraud keywords (FRAUD_KEYWORDS from constants.py), in order of appearance
+        if content_lower is None:
+            content_lower = content.lower()
+        keyword_positions = FRAUD_KEYWORD_MATCHER.first_occurrences(content_lower)
+        found_keywords = list(keyword_positions)
         
         # Determine if this is a fraud case
         is_fraud = category_fraud or len(found_keywords) > 0
@@ -63,13 +257,12 @@ class CaseAnalyzer:
         if is_fraud and found_keywords:
             # Find the first occurrence of any fraud keyword
             first_keyword = found_keywords[0]
-            idx = content_lower.find(first_keyword)
-            if idx != -1:
-                start = max(0, idx - 60)
-                end = min(len(content), idx + 60)
-                evidence = content[start:end].strip()
-                # Add context about which keywords were found
-                evidence = f"Keywords found: {', '.join(found_keywords[:3])} - {evidence}"
+            idx = keyword_positions[first_keyword]
+            start = max(0, idx - 60)
+            end = min(len(content), idx + 60)
+            evidence = content[start:end].strip()
+            # Add context about which keywords were found
+            evidence = f"Keywords found: {', '.join(found_keywords[:3])} - {evidence}"
         
         return CaseFraudInfo(
             is_fraud=is_fraud, 
@@ -77,40 +270,25 @@ class CaseAnalyzer:
             evidence=evidence
         )
 
-    def _is_money_laundering_case(self, content: str):
+    def _is_money_laundering_case(self, content: str, content_lower: Optional[str] = None):
         """
         Determine if a case involves money laundering based on content.
         Returns a dict with is_money_laundering (bool) and evidence (str or None).
+        Pass content_lower when the caller already has it.
         """
-        # Money laundering specific keywords (do NOT include these in fraud_keywords)
-        laundering_keywords = {
-            'money laundering', 'laundering', 'laundered', 'launder',
-            'cleaning money', 'proceeds of crime', 'illicit funds',
-            'placement', 'layering', 'integration',
-            'smurfing', 'structuring', 'shell company',
-            'front company', 'offshore account', 'hawala',
-            'bulk cash', 'wire transfer', 'bank secrecy',
-            'anti-money laundering', 'aml', 'financial crimes enforcement network',
-            'finCEN', 'suspicious activity report', 'sar',
-            'currency transaction report', 'ctr',
-            'unexplained wealth', 'concealment of proceeds',
-            'illegal proceeds', 'dirty money', 'clean money',
-        }
-        content_lower = content.lower()
-        found_keywords = []
-        for keyword in laundering_keywords:
-            if keyword in content_lower:
-                found_keywords.append(keyword)
+        if content_lower is None:
+            content_lower = content.lower()
+        keyword_positions = LAUNDERING_KEYWORD_MATCHER.first_occurrences(content_lower)
+        found_keywords = list(keyword_positions)
         is_laundering = len(found_keywords) > 0
         evidence = None
         if is_laundering and found_keywords:
             first_keyword = found_keywords[0]
-            idx = content_lower.find(first_keyword)
-            if idx != -1:
-                start = max(0, idx - 60)
-                end = min(len(content), idx + 60)
-                evidence = content[start:end].strip()
-                evidence = f"Keywords found: {', '.join(found_keywords[:3])} - {evidence}"
+            idx = keyword_positions[first_keyword]
+            start = max(0, idx - 60)
+            end = min(len(content), idx + 60)
+            evidence = content[start:end].strip()
+            evidence = f"Keywords found: {', '.join(found_keywords[:3])} - {evidence}"
         return {"is_money_laundering": is_laundering, "evidence": evidence}
 
     def extract_main_article_content(self, soup: BeautifulSoup) -> str:
@@ -156,19 +334,21 @@ class CaseAnalyzer:
         try:
             # Extract basic information
             title = self._extract_title(soup)
-            date = self._extract_date(soup)
             content = self.extract_main_article_content(soup)
+            date = self._extract_date(soup)
+            # Lowercased once and shared by every keyword scan below
+            content_lower = content.lower()
             
             # Extract case details
             charges = self._extract_charges(content)
-            case_type = self._determine_case_type(title, content)
+            case_type = self._determine_case_type(title, content, content_lower)
             # Remove extraction of defendant_name, location, disposition, description
             # Categorize charges
-            charge_categories = self.categorizer.categorize_charges(charges, content)
+            charge_categories = self.categorizer.categorize_charges(charges, content, content_lower=content_lower)
             # Determine fraud info
-            fraud_info = self._is_fraud_case(charge_categories, content)
+            fraud_info = self._is_fraud_case(charge_categories, content, content_lower)
             # Determine money laundering info
-            laundering_info = self._is_money_laundering_case(content)
+            laundering_info = self._is_money_laundering_case(content, content_lower)
             # Attach fraud_info and laundering_info to CaseInfo (as attributes)
             case_info = CaseInfo(
                 title=title,
@@ -181,6 +361,7 @@ class CaseAnalyzer:
             case_info.fraud_info = fraud_info
             case_info.money_laundering_flag = laundering_info["is_money_laundering"]
             case_info.money_laundering_evidence = laundering_info["evidence"]
+            
             return case_info
             
         except Exception as e:
@@ -253,33 +434,21 @@ class CaseAnalyzer:
     def _extract_charges(self, content: str) -> List[str]:
         """Extract charges from press release content, handling lists and more patterns."""
         charges = []
-        # Improved charge patterns
-        charge_patterns = [
-            r'charged with ([^.]+)',
-            r'indicted (?:on|for) ([^.]+)',
-            r'convicted of ([^.]+)',
-            r'pleaded guilty to ([^.]+)',
-            r'pled guilty to ([^.]+)',
-            r'count(?:s)? of ([^.]+)',
-            r'violation of ([^.]+)',
-            r'sentenced for ([^.]+)',
-            r'guilty of ([^.]+)',
-            r'for (?:committing|conspiring to commit) ([^.]+)',
-            r'on charges? of ([^.]+)',
-        ]
-        for pattern in charge_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        seen = set()
+        for pattern in CHARGE_PATTERNS:
+            matches = pattern.findall(content)
             for match in matches:
                 # Split on common delimiters and conjunctions
-                for part in re.split(r',|;| and | or |\n|\u2022|- ', match):
+                for part in CHARGE_SPLIT_RE.split(match):
                     charge = self._clean_charge_text(part)
-                    if self._is_valid_charge(charge) and charge not in charges:
+                    if charge not in seen and self._is_valid_charge(charge):
+                        seen.add(charge)
                         charges.append(charge)
         return charges
 
     def extract_indictment_number(self, content: str) -> str:
         """Extract indictment number or details if present."""
-        match = re.search(r'(Indictment\s*(No\.|Number)?\s*[:#]?\s*[A-Za-z0-9\-]+)', content, re.IGNORECASE)
+        match = INDICTMENT_RE.search(content)
         if match:
             return match.group(0).strip()
         return ""
@@ -287,7 +456,7 @@ class CaseAnalyzer:
     def _clean_charge_text(self, text: str) -> str:
         """Clean up extracted charge text."""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = ' '.join(text.split())
         
         # Remove common trailing words
         trailing_words = ['and', 'or', 'including', 'among others', 'etc']
@@ -296,7 +465,7 @@ class CaseAnalyzer:
                 text = text[:-len(word)].strip()
         
         # Remove trailing punctuation except periods that end sentences
-        text = re.sub(r'[,;:]$', '', text)
+        text = TRAILING_PUNCTUATION_RE.sub('', text)
         
         return text
     
@@ -307,7 +476,7 @@ class CaseAnalyzer:
             return False
         
         # Must contain at least one letter
-        if not re.search(r'[a-zA-Z]', charge):
+        if not HAS_LETTER_RE.search(charge):
             return False
         
         # Should not be too long (likely extracted too much)
@@ -331,9 +500,12 @@ class CaseAnalyzer:
         
         return True
     
-    def _determine_case_type(self, title: str, content: str) -> CaseType:
-        """Determine the type of case."""
-        text = (title + " " + content).lower()
+    def _determine_case_type(self, title: str, content: str, content_lower: Optional[str] = None) -> CaseType:
+        """Determine the type of case. Pass content_lower when the caller already has it."""
+        # A handful of short keywords: plain substring scans beat a keyword automaton here
+        if content_lower is None:
+            content_lower = content.lower()
+        text = title.lower() + " " + content_lower
         
         if any(word in text for word in ['indictment', 'indicted', 'criminal', 'convicted']):
             return CaseType.CRIMINAL
@@ -348,17 +520,137 @@ class CaseAnalyzer:
         """Get current date in YYYY-MM-DD format."""
         return datetime.now().strftime("%Y-%m-%d")
 
-    def extract_structured_info_gpt4o(self, text_or_soup, api_key: str = None) -> dict:
-        """
-        Use GPT-4o to extract structured case info from DOJ press release text with enhanced fraud detection.
-        Accepts either raw text or a BeautifulSoup object.
-        """
+    def _resolve_openai_key(self, api_key: Optional[str]) -> str:
+        """Return the OpenAI API key to use, raising if openai or the key is missing."""
         if openai is None:
             raise ImportError("openai package is required for GPT-4o extraction. Please install with 'pip install openai'.")
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OpenAI API key must be provided via argument or OPENAI_API_KEY env var.")
+        return api_key
+
+    def _gpt4o_completion(self, prompt: str, api_key: str, max_tokens: int = 1500,
+                          client=None, response_format: dict = GPT4O_RESPONSE_FORMAT) -> str:
+        """Return GPT-4o message content for a prompt, served from the disk cache when possible."""
+        cache_key, content = _gpt4o_cache_get(prompt, max_tokens, response_format)
+        if content is None:
+            content = self._request_gpt4o_completion(prompt, api_key, max_tokens, client,
+                                                     response_format)
+            _gpt4o_cache_put(cache_key, content, response_format)
+        return content
+
+    def _request_gpt4o_completion(self, prompt: str, api_key: str, max_tokens: int,
+                                  client=None, response_format: dict = GPT4O_RESPONSE_FORMAT) -> str:
+        """Send one GPT-4o chat completion and return the message content."""
+        messages = self._gpt4o_messages(prompt)
+        if hasattr(openai, "OpenAI"):
+            # OpenAI v1.x API
+            client = client or openai.OpenAI(api_key=api_key)
+            response = client.chat.completions.create(
+                model="gpt-4o", messages=messages, temperature=0.1, max_tokens=max_tokens,
+                response_format=response_format
+            )
+            return response.choices[0].message.content or ""
+        # Legacy OpenAI v0.x API
         openai.api_key = api_key
+        response = openai.ChatCompletion.create(
+            model="gpt-4o", messages=messages, temperature=0.1, max_tokens=max_tokens
+        )
+        return response['choices'][0]['message']['content'] or ""
+
+    @staticmethod
+    def _gpt4o_messages(prompt: str) -> List[dict]:
+        """Chat messages for a GPT-4o extraction prompt."""
+        return [
+            {"role": "system", "content": GPT4O_SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt}
+        ]
+
+    @staticmethod
+    def _strip_code_fence(content: str) -> str:
+        """Return the JSON inside a markdown code block (```json ... ```), or content unchanged."""
+        if content.startswith('```') and '```' in content[3:]:
+            start = content.find('```') + 3
+            end = content.rfind('```')
+            if start < end:
+                json_content = content[start:end].strip()
+                # Remove language identifier if present
+                if json_content.startswith('json'):
+                    json_content = json_content[4:].strip()
+                return json_content
+        return content
+
+    @staticmethod
+    def _gpt4o_error_result(content: str, error: str) -> dict:
+        """Build the result returned when a GPT-4o response cannot be used."""
+        return {
+            "fraud_flag": False,
+            "fraud_type": None,
+            "fraud_evidence": None,
+            "fraud_rationale": None,
+            "title": "Error parsing response",
+            "date": None,
+            "charges": [],
+            "indictment_number": None,
+            "charge_count": 0,
+            "raw_response": content,
+            "error": error
+        }
+
+    def _finalize_gpt4o_result(self, result: dict, text: str) -> dict:
+        """Fill missing fields, enforce fraud-field consistency and add the classic cross-checks."""
+        # Ensure all required fields are present
+        required_fields = ['fraud_flag', 'fraud_type', 'fraud_evidence', 'fraud_rationale', 'title', 'date', 'charges', 'indictment_number', 'charge_count']
+        for field in required_fields:
+            if field not in result:
+                if field == 'charges':
+                    result[field] = []
+                elif field == 'charge_count':
+                    result[field] = len(result.get('charges', []))
+                elif field == 'fraud_flag':
+                    result[field] = False
+                else:
+                    result[field] = None
+        # Ensure charges is always a list
+        if not isinstance(result.get('charges'), list):
+            result['charges'] = []
+        # Update charge_count if not accurate
+        result['charge_count'] = len(result['charges'])
+
+        # --- Post-process for logical consistency ---
+        if result.get('fraud_type') or result.get('fraud_evidence'):
+            result['fraud_flag'] = True
+        if not result.get('fraud_flag'):
+            result['fraud_type'] = None
+            result['fraud_evidence'] = None
+            result['fraud_rationale'] = None
+        # ---
+
+        # --- Classic fraud detection cross-check ---
+        charges = result.get('charges', [])
+        text_lower = text.lower()
+        charge_categories = self.categorizer.categorize_charges(charges, text, content_lower=text_lower)
+        classic_fraud_info = self._is_fraud_case(charge_categories, text, text_lower)
+        result['classic_fraud_flag'] = bool(classic_fraud_info.is_fraud)
+        result['classic_fraud_evidence'] = classic_fraud_info.evidence
+        result['classic_fraud_categories'] = [cat.value for cat in charge_categories]
+        # --- Money laundering detection ---
+        laundering_info = self._is_money_laundering_case(text, text_lower)
+        result['money_laundering_flag'] = laundering_info["is_money_laundering"]
+        result['money_laundering_evidence'] = laundering_info["evidence"]
+        # ---
+        return result
+
+    def extract_structured_info_gpt4o(self, text_or_soup, api_key: str = None,
+                                      max_tokens: int = 1500, client=None) -> dict:
+        """
+        Use GPT-4o to extract structured case info from DOJ press release text with enhanced fraud detection.
+        Accepts either raw text or a BeautifulSoup object.
+        
+        The reply is constrained to GPT4O_CASE_SCHEMA; max_tokens caps the reply length.
+        Pass an openai.OpenAI client to reuse its connection pool across calls.
+        """
+        api_key = self._resolve_openai_key(api_key)
         
         # If input is soup, extract main article content
         if isinstance(text_or_soup, BeautifulSoup):
@@ -366,130 +658,173 @@ class CaseAnalyzer:
         else:
             text = text_or_soup
         
-        # Use FRAUD_KEYWORDS from constants.py for LLM prompt
-        fraud_keywords = FRAUD_KEYWORDS
-        
-        prompt = f"""
-You are a DOJ fraud legal researcher. Your primary task is to determine, with legal precision, whether the following DOJ press release describes a fraud case. Focus on legal standards, context, and the substance of the charges or conduct described. Ignore generic or irrelevant mentions of 'fraud' (e.g., in disclaimers, unrelated news, or boilerplate language). Only mark fraud_flag as true if the facts, charges, or context clearly indicate a fraud, scam, scheme, or deceptive practice as defined by law.
-
-Extract the following fields as a JSON object (fraud_flag must be the first field):
-- fraud_flag: Boolean, true if this is a fraud case, false otherwise (this is the key field)
-- fraud_type: If fraud_flag is true, categorize the fraud type from: financial_fraud, healthcare_fraud, disaster_fraud, consumer_fraud, government_fraud, business_fraud, immigration_fraud, intellectual_property_fraud, general_fraud, or null if not fraud
-- fraud_evidence: If fraud_flag is true, provide a brief snippet of evidence (string), otherwise null
-- fraud_rationale: 1-2 sentences explaining why you classified this as fraud or not, referencing legal context or charge language
-- title: The title of the press release
-- date: The date of the press release
-- charges: List all charges mentioned (array of strings)
-- indictment_number: Indictment number if present, otherwise null
-- charge_count: Number of charges found
-
-FRAUD DETECTION GUIDELINES:
-Use these keywords to identify fraud cases:
-{json.dumps(fraud_keywords, indent=2)}
+        content = self._gpt4o_completion(self.build_gpt4o_prompt(text), api_key,
+                                         max_tokens=max_tokens, client=client)
+        return self.parse_gpt4o_response(content, text)
 
-A case should be marked as fraud if it contains any of these keywords in a legally relevant context, or involves deceptive practices, schemes, or false representations as defined by law. Do not mark as fraud for generic mentions or unrelated uses of the word.
-
-LOGICAL CONSISTENCY RULES:
-- If you set fraud_type or fraud_evidence, you MUST set fraud_flag to true.
-- If fraud_flag is false, fraud_type, fraud_evidence, and fraud_rationale must all be null.
-- If fraud_type is not null or fraud_evidence is not null, fraud_flag must be true.
-- If fraud_flag is false, fraud_type and fraud_evidence must be null.
-- All fields must be logically consistent.
-
-Return your answer as a JSON object with exactly these fields, in the order listed above.
-
-Press Release:
-{text}
+    async def extract_structured_info_gpt4o_async(self, text_or_soup, api_key: str = None, client=None,
+                                                  max_tokens: int = 1500) -> dict:
         """
+        Async variant of extract_structured_info_gpt4o using openai.AsyncOpenAI.
         
-        response = openai.ChatCompletion.create(
+        Args:
+            text_or_soup: Raw text or BeautifulSoup object
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            client: Optional AsyncOpenAI client to reuse across calls
+            max_tokens: Cap on the reply length
+            
+        Returns:
+            Result dict, as returned by extract_structured_info_gpt4o
+        """
+        api_key = self._resolve_openai_key(api_key)
+        if isinstance(text_or_soup, BeautifulSoup):
+            text = self.extract_main_article_content(text_or_soup)
+        else:
+            text = text_or_soup
+        
+        prompt = self.build_gpt4o_prompt(text)
+        cache_key, content = _gpt4o_cache_get(prompt, max_tokens)
+        if content is None:
+            if client is None:
+                # A client created here is closed here; a passed-in client belongs to the caller
+                async with openai.AsyncOpenAI(api_key=api_key) as own_client:
+                    content = await self._request_gpt4o_completion_async(prompt, max_tokens, own_client)
+            else:
+                content = await self._request_gpt4o_completion_async(prompt, max_tokens, client)
+            _gpt4o_cache_put(cache_key, content)
+        return self.parse_gpt4o_response(content, text)
+
+    async def _request_gpt4o_completion_async(self, prompt: str, max_tokens: int, client) -> str:
+        """Send one GPT-4o chat completion on an AsyncOpenAI client and return the message content."""
+        response = await client.chat.completions.create(
             model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a DOJ legal research assistant specializing in fraud case identification and legal data extraction. Always apply legal standards and context when determining fraud."},
-                {"role": "user", "content": prompt}
-            ],
+            messages=self._gpt4o_messages(prompt),
             temperature=0.1,
-            max_tokens=1500
+            max_tokens=max_tokens,
+            response_format=GPT4O_RESPONSE_FORMAT
         )
+        return response.choices[0].message.content or ""
+
+    async def extract_structured_info_gpt4o_many(self, texts_or_soups: List, api_key: str = None,
+                                                 max_concurrency: int = 8) -> List[dict]:
+        """
+        Run one GPT-4o extraction per press release concurrently.
         
-        # Try to parse the response as JSON
-        content = response['choices'][0]['message']['content']
+        Args:
+            texts_or_soups: Raw texts or BeautifulSoup objects
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            max_concurrency: Maximum requests in flight, to stay clear of rate limits
+            
+        Returns:
+            List of result dicts in the same order as the inputs
+        """
+        api_key = self._resolve_openai_key(api_key)
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # Handle markdown code blocks (```json ... ```)
-        if content.startswith('```') and '```' in content[3:]:
-            # Extract JSON from markdown code block
-            start = content.find('```') + 3
-            end = content.rfind('```')
-            if start < end:
-                json_content = content[start:end].strip()
-                # Remove language identifier if present
-                if json_content.startswith('json'):
-                    json_content = json_content[4:].strip()
-                content = json_content
+        async with openai.AsyncOpenAI(api_key=api_key) as client:
+            async def extract_one(item):
+                async with semaphore:
+                    try:
+                        return await self.extract_structured_info_gpt4o_async(item, api_key, client)
+                    except Exception as e:
+                        logger.error(f"GPT-4o request failed: {e}")
+                        return self._gpt4o_error_result("", str(e))
+            
+            return list(await asyncio.gather(*(extract_one(item) for item in texts_or_soups)))
+
+    def build_gpt4o_prompt(self, text: str) -> str:
+        """Build the single-case GPT-4o user prompt; the instructions live in the system message."""
+        return f"Press Release:\n{text}"
+
+    def parse_gpt4o_response(self, content: str, text: str) -> dict:
+        """
+        Turn a raw single-case GPT-4o reply into a result dict.
         
+        Args:
+            content: Message content returned by the model
+            text: Press release text the prompt was built from
+            
+        Returns:
+            Normalised result with classic cross-check fields, or an error result
+        """
+        content = self._strip_code_fence(content)
         # After parsing the GPT-4o result, also run classic fraud detection for comparison
         try:
-            result = json.loads(content)
-            # Ensure all required fields are present
-            required_fields = ['fraud_flag', 'fraud_type', 'fraud_evidence', 'fraud_rationale', 'title', 'date', 'charges', 'indictment_number', 'charge_count']
-            for field in required_fields:
-                if field not in result:
-                    if field == 'charges':
-                        result[field] = []
-                    elif field == 'charge_count':
-                        result[field] = len(result.get('charges', []))
-                    elif field == 'fraud_flag':
-                        result[field] = False
-                    else:
-                        result[field] = None
-            # Ensure charges is always a list
-            if not isinstance(result.get('charges'), list):
-                result['charges'] = []
-            # Update charge_count if not accurate
-            result['charge_count'] = len(result['charges'])
-
-            # --- Post-process for logical consistency ---
-            if result.get('fraud_type') or result.get('fraud_evidence'):
-                result['fraud_flag'] = True
-            if not result.get('fraud_flag'):
-                result['fraud_type'] = None
-                result['fraud_evidence'] = None
-                result['fraud_rationale'] = None
-            # ---
-
-            # --- Classic fraud detection cross-check ---
-            charges = result.get('charges', [])
-            charge_categories = self.categorizer.categorize_charges(charges, text)
-            classic_fraud_info = self._is_fraud_case(charge_categories, text)
-            result['classic_fraud_flag'] = bool(classic_fraud_info.is_fraud)
-            result['classic_fraud_evidence'] = classic_fraud_info.evidence
-            result['classic_fraud_categories'] = [cat.value for cat in charge_categories]
-            # --- Money laundering detection ---
-            laundering_info = self._is_money_laundering_case(text)
-            result['money_laundering_flag'] = laundering_info["is_money_laundering"]
-            result['money_laundering_evidence'] = laundering_info["evidence"]
-            # ---
-            return result
+            return self._finalize_gpt4o_result(json.loads(content), text)
         except Exception as e:
             logger.error(f"Error parsing GPT-4o response: {e}")
-            return {
-                "fraud_flag": False,
-                "fraud_type": None,
-                "fraud_evidence": None,
-                "fraud_rationale": None,
-                "title": "Error parsing response",
-                "date": None,
-                "charges": [],
-                "indictment_number": None,
-                "charge_count": 0,
-                "raw_response": content,
-                "error": str(e)
-            }
+            return self._gpt4o_error_result(content, str(e))
+
+    def extract_structured_info_gpt4o_batch(self, texts_or_soups: List, api_key: str = None) -> List[dict]:
+        """
+        Run GPT-4o extraction for several press releases in a single chat completion.
+        
+        The releases are numbered CASE 1..N in one prompt and the model replies with a
+        JSON array of per-case objects keyed by "idx", which are dispatched back in order.
+        
+        Args:
+            texts_or_soups: Raw texts or BeautifulSoup objects, one per press release
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            
+        Returns:
+            List of result dicts in the same order as the inputs
+        """
+        if not texts_or_soups:
+            return []
+        api_key = self._resolve_openai_key(api_key)
+        texts = [
+            self.extract_main_article_content(item) if isinstance(item, BeautifulSoup) else item
+            for item in texts_or_soups
+        ]
+        
+        cases_block = "\n\n".join(f"CASE {idx}:\n{text}" for idx, text in enumerate(texts, 1))
+        prompt = f"""
+You are given {len(texts)} press releases, numbered CASE 1 to CASE {len(texts)}. Analyze each one independently.
+Return {{"cases": [...]}} with one object per case. Each object must have an "idx" field with the case number,
+followed by the fields described above.
+
+Press Releases:
+{cases_block}
+        """
+        
+        # Output grows with the number of cases; 16000 stays under the GPT-4o output limit
+        max_tokens = min(1500 * len(texts), 16000)
+        content = self._strip_code_fence(self._gpt4o_completion(
+            prompt, api_key, max_tokens=max_tokens, response_format=GPT4O_BATCH_RESPONSE_FORMAT
+        ))
+        
+        try:
+            parsed = json.loads(content)
+        except Exception as e:
+            logger.error(f"Error parsing GPT-4o batch response: {e}")
+            return [self._gpt4o_error_result(content, str(e)) for _ in texts]
+        if isinstance(parsed, dict):
+            # Tolerate a wrapping object such as {"cases": [...]}
+            parsed = next((v for v in parsed.values() if isinstance(v, list)), [])
+        
+        by_idx = {}
+        for item in parsed:
+            if isinstance(item, dict) and isinstance(item.get("idx"), int):
+                by_idx[item.pop("idx")] = item
+        
+        results = []
+        for idx, text in enumerate(texts, 1):
+            item = by_idx.get(idx)
+            if item is None:
+                results.append(self._gpt4o_error_result(content, f"No result returned for case {idx}"))
+                continue
+            try:
+                results.append(self._finalize_gpt4o_result(item, text))
+            except Exception as e:
+                logger.error(f"Error processing GPT-4o batch result {idx}: {e}")
+                results.append(self._gpt4o_error_result(json.dumps(item), str(e)))
+        return results
 
     def identify_fraud_and_rationale(self, content: str) -> dict:
         charges = self._extract_charges(content)
-        charge_categories = self.categorizer.categorize_charges(charges, content)
-        fraud_info = self._is_fraud_case(charge_categories, content)
+        content_lower = content.lower()
+        charge_categories = self.categorizer.categorize_charges(charges, content, content_lower=content_lower)
+        fraud_info = self._is_fraud_case(charge_categories, content, content_lower)
         return {
             "is_fraud": fraud_info.is_fraud,
             "evidence": fraud_info.evidence,
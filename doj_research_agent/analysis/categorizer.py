@@ -1,8 +1,9 @@
 """Charge categorization functionality."""
 
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 from ..core.models import ChargeCategory
 from ..core.utils import setup_logger
+from .keyword_matcher import KeywordMatcher
 import openai
 
 logger = setup_logger(__name__)
@@ -14,6 +15,8 @@ class ChargeCategorizer:
     def __init__(self):
         """Initialize categorizer with keyword mappings."""
         self.category_keywords = self._build_category_keywords()
+        # Built lazily from category_keywords and dropped whenever keywords change
+        self._matcher = None
     
     def _build_category_keywords(self) -> Dict[ChargeCategory, Set[str]]:
         """Build keyword mappings for charge categories based on DOJ topics."""
@@ -154,13 +157,15 @@ class ChargeCategorizer:
             ChargeCategory.OTHER: set()
         }
     
-    def categorize_charges(self, charges: List[str], content: str = "") -> List[ChargeCategory]:
+    def categorize_charges(self, charges: List[str], content: str = "",
+                           content_lower: Optional[str] = None) -> List[ChargeCategory]:
         """
         Categorize charges based on keywords and content.
         
         Args:
             charges: List of charge descriptions
             content: Additional content to analyze
+            content_lower: content already lowercased by the caller, to avoid lowercasing it again
             
         Returns:
             List of charge categories
@@ -168,12 +173,14 @@ class ChargeCategorizer:
         categories = set()
         
         # Combine charges and content for analysis
-        text_to_analyze = " ".join(charges + [content]).lower()
+        if content_lower is None:
+            text_to_analyze = " ".join(charges + [content]).lower()
+        else:
+            text_to_analyze = " ".join([charge.lower() for charge in charges] + [content_lower])
         
-        # Check each category for keyword matches
-        for category, keywords in self.category_keywords.items():
-            if self._has_keyword_match(text_to_analyze, keywords):
-                categories.add(category)
+        # Single pass over the text matching every keyword of every category
+        for keyword_categories in self._get_matcher().payloads(text_to_analyze):
+            categories.update(keyword_categories)
         
         # Return as list, defaulting to OTHER if no matches
         result = list(categories) if categories else [ChargeCategory.OTHER]
@@ -187,21 +194,22 @@ class ChargeCategorizer:
         """
         return self.categorize_charges([charge], content)
     
-    def _has_keyword_match(self, text: str, keywords: Set[str]) -> bool:
+    def _get_matcher(self) -> KeywordMatcher:
         """
-        Check if text contains any of the keywords.
+        Get the keyword matcher over all category keywords.
         
-        Args:
-            text: Text to search
-            keywords: Set of keywords to look for
-            
         Returns:
-            True if any keyword is found
+            Matcher mapping each keyword to the categories it belongs to
         """
-        for keyword in keywords:
-            if keyword in text:
-                return True
-        return False
+        if self._matcher is None:
+            keyword_categories: Dict[str, Set[ChargeCategory]] = {}
+            for category, keywords in self.category_keywords.items():
+                for keyword in keywords:
+                    keyword_categories.setdefault(keyword, set()).add(category)
+            self._matcher = KeywordMatcher(
+                {keyword: tuple(categories) for keyword, categories in keyword_categories.items()}
+            )
+        return self._matcher
     
     def get_category_description(self, category: ChargeCategory) -> str:
         """
@@ -250,6 +258,7 @@ class ChargeCategorizer:
             self.category_keywords[category].update(keywords)
         else:
             self.category_keywords[category] = keywords
+        self._matcher = None
         
         logger.info(f"Added {len(keywords)} keywords to category {category.value}")
     
@@ -263,6 +272,7 @@ class ChargeCategorizer:
         """
         if category in self.category_keywords:
             self.category_keywords[category] -= keywords
+            self._matcher = None
             logger.info(f"Removed {len(keywords)} keywords from category {category.value}")
     
     def get_keywords_for_category(self, category: ChargeCategory) -> Set[str]:
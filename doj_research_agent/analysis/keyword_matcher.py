@@ -0,0 +1,109 @@
+"""Single-pass multi-keyword matching for fraud and charge keyword tables."""
+
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+try:
+    import ahocorasick  # Optional: pip install pyahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Trie node key marking the end of a keyword; never a single text character
+_END = ""
+
+
+class KeywordMatcher:
+    """Match a fixed set of keywords against text as substrings in one pass."""
+
+    def __init__(self, keywords: Mapping[str, Any]):
+        """
+        Compile the keyword table.
+
+        Args:
+            keywords: Mapping of lowercase keyword to the payload returned when it matches
+        """
+        self.keywords = dict(keywords)
+        self._automaton = None
+        self._trie: Dict[str, Any] = {}
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword, payload in self.keywords.items():
+                automaton.add_word(keyword, (keyword, payload))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # Keywords sharing a prefix ("medicare fraud", "medicaid fraud") share trie nodes.
+            # Plain dict nodes are kept deliberately: in CPython, compressed string edges and
+            # other fanout-specific layouts measured slower, since per-character dict lookups
+            # are cheaper than the extra tuple unpacking and calls. The compact, cache-friendly
+            # layout comes from the native pyahocorasick automaton above.
+            for keyword in self.keywords:
+                node = self._trie
+                for char in keyword:
+                    node = node.setdefault(char, {})
+                node[_END] = keyword
+
+    @classmethod
+    def from_keywords(cls, keywords: Iterable[str]) -> "KeywordMatcher":
+        """Build a matcher whose payload for each keyword is the keyword itself."""
+        return cls({keyword: keyword for keyword in keywords})
+
+    def first_occurrences(self, text: str) -> Dict[str, int]:
+        """
+        Find every keyword that occurs in the text.
+
+        Args:
+            text: Lowercased text to search
+
+        Returns:
+            Mapping of matched keyword to the start index of its first occurrence,
+            ordered by that index
+        """
+        found: List[Tuple[int, str]] = []
+        if self._automaton is not None:
+            seen = set()
+            for end, (keyword, _) in self._automaton.iter(text):
+                if keyword not in seen:
+                    seen.add(keyword)
+                    found.append((end - len(keyword) + 1, keyword))
+        else:
+            # One trie descent per start position collects every keyword starting there
+            root = self._trie
+            seen = set()
+            length = len(text)
+            for start in range(length):
+                node = root.get(text[start])
+                pos = start + 1
+                while node is not None:
+                    keyword = node.get(_END)
+                    if keyword is not None and keyword not in seen:
+                        seen.add(keyword)
+                        found.append((start, keyword))
+                    if pos == length:
+                        break
+                    node = node.get(text[pos])
+                    pos += 1
+        found.sort()
+        return {keyword: idx for idx, keyword in found}
+
+    def contains_any(self, text: str) -> bool:
+        """Return True as soon as any keyword is found in the text."""
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        root = self._trie
+        length = len(text)
+        for start in range(length):
+            node = root.get(text[start])
+            pos = start + 1
+            while node is not None:
+                if _END in node:
+                    return True
+                if pos == length:
+                    break
+                node = node.get(text[pos])
+                pos += 1
+        return False
+
+    def payloads(self, text: str) -> List[Any]:
+        """Return the payloads of all keywords found in the text, one per matched keyword."""
+        return [self.keywords[keyword] for keyword in self.first_occurrences(text)]
@@ -105,6 +105,51 @@ class CaseInfo:
             charge_categories=[ChargeCategory(cat) for cat in data.get("charge_categories", [])],
             extraction_date=datetime.fromisoformat(data["extraction_date"]) if data.get("extraction_date") else None
         )
+    
+    @classmethod
+    def bulk_from_records(cls, records: List[dict]) -> List["CaseInfo"]:
+        """
+        Create instances from many dictionaries at once.
+        
+        Equivalent to calling from_dict per record, but fills each instance's
+        attributes directly instead of going through __init__ (still running
+        __post_init__), and parses each distinct extraction date only once.
+        """
+        case_types = {case_type.value: case_type for case_type in CaseType}
+        categories = {category.value: category for category in ChargeCategory}
+        parsed_dates: dict = {}
+        
+        cases = []
+        for data in records:
+            raw_date = data.get("extraction_date")
+            if raw_date and raw_date not in parsed_dates:
+                parsed_dates[raw_date] = datetime.fromisoformat(raw_date)
+            
+            try:
+                case_type = case_types[data.get("case_type", "unknown")]
+                charge_categories = [categories[cat] for cat in data.get("charge_categories", [])]
+            except KeyError:
+                # Unknown values raise the same ValueError as from_dict
+                case_type = CaseType(data.get("case_type", "unknown"))
+                charge_categories = [ChargeCategory(cat) for cat in data.get("charge_categories", [])]
+            
+            case = cls.__new__(cls)
+            case.__dict__.update(
+                title=data.get("title", ""),
+                date=data.get("date", ""),
+                url=data.get("url", ""),
+                charges=data.get("charges", []),
+                case_type=case_type,
+                charge_categories=charge_categories,
+                extraction_date=parsed_dates[raw_date] if raw_date else None,
+                fraud_info=None,
+                money_laundering_flag=None,
+                money_laundering_evidence=None,
+                gpt4o=None,
+            )
+            case.__post_init__()
+            cases.append(case)
+        return cases
 
 
 @dataclass
@@ -4,11 +4,15 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-import pandas as pd
-from rich.console import Console
-from rich.table import Table
+from pydantic import BaseModel, ConfigDict, InstanceOf, ValidationError
+
+try:
+    import orjson  # Optional: faster JSON encoding for result files
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .models import AnalysisResult, CaseInfo, ChargeCategory
 
@@ -39,18 +43,31 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     return logger
 
 
-def save_to_json(data: Any, filepath: str, indent: int = 2) -> None:
+def save_to_json(data: Any, filepath: str, indent: Optional[int] = 2) -> None:
     """
     Save data to JSON file.
     
+    Uses orjson when it is installed and the indent is 2 or None, the only
+    layouts orjson supports.
+    
     Args:
         data: Data to save
         filepath: Path to save file
-        indent: JSON indentation
+        indent: JSON indentation, or None for compact output
     """
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
+    if ORJSON_AVAILABLE and indent in (2, None):
+        # Datetimes and dataclasses go through default=str, as with json.dump
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                  | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=option, default=str))
+        return
+    
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
 
@@ -92,7 +109,7 @@ def load_analysis_result(filepath: str) -> AnalysisResult:
     """
     data = load_from_json(filepath)
     
-    cases = [CaseInfo.from_dict(case_data) for case_data in data['cases']]
+    cases = CaseInfo.bulk_from_records(data['cases'])
     
     return AnalysisResult(
         cases=cases,
@@ -161,6 +178,9 @@ def export_to_csv(cases: List[CaseInfo], filepath: str) -> None:
     if not cases:
         return
     
+    # Imported lazily: pandas is only needed for CSV export
+    import pandas as pd
+    
     # Convert to DataFrame
     df = pd.DataFrame([case.to_dict() for case in cases])
     
@@ -181,6 +201,9 @@ def display_summary_table(summary: Dict[str, Any]) -> None:
     Args:
         summary: Summary statistics dictionary
     """
+    from rich.console import Console
+    from rich.table import Table
+    
     console = Console()
     
     # Overall statistics
@@ -247,6 +270,7 @@ def filter_cases_by_category(cases: List[CaseInfo], category: ChargeCategory) ->
     Returns:
         Filtered list of cases
     """
+    # A case has only a handful of categories, so scanning the list beats building a set
     return [case for case in cases if category in case.charge_categories]
 
 
@@ -283,6 +307,24 @@ def get_unique_charges(cases: List[CaseInfo]) -> List[str]:
     return sorted(list(all_charges))
 
 
+class _ConfigSchema(BaseModel):
+    """Schema checked by validate_config; unknown keys are allowed."""
+    model_config = ConfigDict(extra="allow")
+    
+    # InstanceOf keeps the isinstance() semantics, so bools pass as ints
+    base_url: Any
+    max_pages: InstanceOf[int]
+    max_cases: InstanceOf[int]
+    delay_between_requests: Union[InstanceOf[int], InstanceOf[float]] = 1.0
+
+
+_CONFIG_TYPE_ERRORS = {
+    "max_pages": "max_pages must be an integer",
+    "max_cases": "max_cases must be an integer",
+    "delay_between_requests": "delay_between_requests must be a number",
+}
+
+
 def validate_config(config: Dict[str, Any]) -> List[str]:
     """
     Validate configuration dictionary.
@@ -293,22 +335,18 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     Returns:
         List of validation errors
     """
-    errors = []
-    
-    # Required fields
-    required_fields = ['base_url', 'max_pages', 'max_cases']
-    for field in required_fields:
-        if field not in config:
-            errors.append(f"Missing required field: {field}")
-    
-    # Type validations
-    if 'max_pages' in config and not isinstance(config['max_pages'], int):
-        errors.append("max_pages must be an integer")
-    
-    if 'max_cases' in config and not isinstance(config['max_cases'], int):
-        errors.append("max_cases must be an integer")
-    
-    if 'delay_between_requests' in config and not isinstance(config['delay_between_requests'], (int, float)):
-        errors.append("delay_between_requests must be a number")
+    try:
+        _ConfigSchema.model_validate(config)
+    except ValidationError as e:
+        # Report every missing field before any type error
+        missing = []
+        type_errors = []
+        for error in e.errors():
+            field = error["loc"][0]
+            if error["type"] == "missing":
+                missing.append(f"Missing required field: {field}")
+            elif _CONFIG_TYPE_ERRORS[field] not in type_errors:
+                type_errors.append(_CONFIG_TYPE_ERRORS[field])
+        return missing + type_errors
     
-    return errors
\ No newline at end of file
+    return []
@@ -7,6 +7,7 @@ models using LLM-as-a-Judge techniques with RAGAS framework.
 
 import json
 import logging
+import random
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
@@ -36,6 +37,7 @@ from ..llm.llm_models import CaseAnalysisResponse
 from .evaluation_types import EvaluationResult, TestCase
 from .langfuse_integration import trace_evaluation, get_langfuse_tracer
 from ..core.constants import FRAUD_KEYWORDS
+from ..core.utils import save_to_json
 
 logger = logging.getLogger(__name__)
 
@@ -155,7 +157,10 @@ class FraudDetectionEvaluator:
                  use_llm_judge: bool = True,
                  judge_provider: str = "openai",
                  judge_model: str = "gpt-4o",
-                 judge_api_key: Optional[str] = None):
+                 judge_api_key: Optional[str] = None,
+                 judge_sample_rate: float = 0.2,
+                 judge_on_mismatch_only: bool = True,
+                 judge_seed: int = 0):
         """
         Initialize the evaluator.
         
@@ -167,12 +172,20 @@ class FraudDetectionEvaluator:
             judge_provider: Provider for judge model
             judge_model: Judge model name
             judge_api_key: API key for judge model
+            judge_sample_rate: Fraction of correctly predicted cases still sent to the judge
+            judge_on_mismatch_only: Judge every mispredicted case but only a sample of the
+                correct ones; set False to judge every case
+            judge_seed: Seed for the sample of correct cases; the same seed and cases
+                always select the same sample
         """
         self.model_provider = model_provider
         self.model_name = model_name
         self.model_api_key = model_api_key
         
         self.use_llm_judge = use_llm_judge
+        self.judge_sample_rate = judge_sample_rate
+        self.judge_on_mismatch_only = judge_on_mismatch_only
+        self.judge_seed = judge_seed
         if use_llm_judge:
             self.llm_judge = LLMJudge(
                 judge_provider=judge_provider,
@@ -322,11 +335,14 @@ class FraudDetectionEvaluator:
             }
             
             # Add LLM judge evaluation if enabled
-            if self.use_llm_judge:
+            if self._should_judge(result):
                 judgment = self.llm_judge.judge_fraud_classification(
                     test_case.text, prediction, test_case
                 )
                 result['llm_judgment'] = judgment
+            elif self.use_llm_judge:
+                # Correct case left out of the judge sample
+                result['judge_skipped'] = True
             
             return result
             
@@ -342,6 +358,17 @@ class FraudDetectionEvaluator:
                 'error': str(e)
             }
     
+    def _should_judge(self, result: Dict) -> bool:
+        """Decide whether a case is worth a judge call: always on a mismatch, sampled otherwise."""
+        if not self.use_llm_judge:
+            return False
+        if not self.judge_on_mismatch_only or not result['overall_correct']:
+            return True
+        # Seeded per case, so a case is sampled the same way on every run and in any order
+        test_case = result['test_case']
+        case_id = test_case.source_url or test_case.title or test_case.text
+        return random.Random(f"{self.judge_seed}:{case_id}").random() < self.judge_sample_rate
+    
     def evaluate_dataset(self, test_cases: Optional[List[TestCase]] = None, 
                         enable_langfuse_tracing: bool = True) -> EvaluationResult:
         """Evaluate the model on a dataset of test cases."""
@@ -399,7 +426,10 @@ class FraudDetectionEvaluator:
                     metadata={
                         "evaluation_type": "synthetic_dataset",
                         "total_cases": len(test_cases),
-                        "use_llm_judge": self.use_llm_judge
+                        "use_llm_judge": self.use_llm_judge,
+                        "judge_sample_rate": self.judge_sample_rate,
+                        "judge_on_mismatch_only": self.judge_on_mismatch_only,
+                        "judge_seed": self.judge_seed
                     }
                 )
                 if trace_id:
@@ -523,6 +553,8 @@ Actual    No    {evaluation_result.confusion_matrix[0][0]}     {evaluation_resul
                 judgment = result['llm_judgment']
                 report += f"- **LLM Judge Score:** {judgment.get('overall_quality', 'N/A')}/10\n"
                 report += f"- **Judge Feedback:** {judgment.get('judgment_explanation', 'N/A')}\n"
+            elif result.get('judge_skipped'):
+                report += "- **LLM Judge:** skipped (correct case not in the judge sample)\n"
             
             report += "\n"
         
@@ -579,11 +611,12 @@ Actual    No    {evaluation_result.confusion_matrix[0][0]}     {evaluation_resul
             
             if 'llm_judgment' in result:
                 serializable_result['llm_judgment'] = result['llm_judgment']
+            elif result.get('judge_skipped'):
+                serializable_result['judge_skipped'] = True
             
             serializable_results['detailed_results'].append(serializable_result)
         
-        with open(filepath, 'w') as f:
-            json.dump(serializable_results, f, indent=2)
+        save_to_json(serializable_results, filepath)
         
         logger.info(f"Evaluation results saved to {filepath}")
 
@@ -140,7 +140,12 @@ class LangfuseTracer:
                     "precision": evaluation_result.precision,
                     "recall": evaluation_result.recall,
                     "f1_score": evaluation_result.f1_score,
-                    "total_cases": len(test_cases)
+                    "total_cases": len(test_cases),
+                    # Cases with no llm_judge_quality score because sampling skipped the judge
+                    "judge_skipped_cases": [
+                        i + 1 for i, result in enumerate(evaluation_result.detailed_results)
+                        if result.get('judge_skipped')
+                    ]
                 })
             
             # Flush to send data
@@ -2,6 +2,7 @@
 Orchestrates the scraping and analysis of DOJ press releases using LangGraph.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, TypedDict, Annotated
 import operator
 
@@ -11,13 +12,16 @@ from .analysis.analyzer import CaseAnalyzer
 from .core.models import AnalysisResult, CaseInfo, ScrapingConfig, FeedbackData
 from .core.feedback_manager import FeedbackManager
 from .core.feedback_improver import FeedbackBasedImprover
-from .scraping.scraper import DOJScraper
+from .scraping.scraper import DOJScraper, HTTP_POOL_SIZE, RATE_LIMIT_BURST, TokenBucket
 from .core.utils import save_analysis_result, setup_logger
 from .evaluation.evaluate import FraudDetectionEvaluator
 from .evaluation.evaluation_types import EvaluationResult, TestCase
 
 logger = setup_logger(__name__)
 
+# URLs analyzed concurrently per analyze_url step; matches the scraper's connection pool
+ANALYZE_BATCH_SIZE = HTTP_POOL_SIZE
+
 
 class ResearchState(TypedDict):
     """Defines the state for the research graph."""
@@ -45,6 +49,9 @@ class ResearchOrchestrator:
             scraping_config: Configuration for the scraper.
         """
         self.scraping_config = scraping_config or ScrapingConfig()
+        self._scraper: Optional[DOJScraper] = None
+        self._analyzer: Optional[CaseAnalyzer] = None
+        self._fetch_bucket: Optional[TokenBucket] = None
         self.graph = self._build_graph()
 
     def _build_graph(self) -> StateGraph:
@@ -77,10 +84,29 @@ class ResearchOrchestrator:
 
         return workflow.compile()
 
+    def _get_scraper(self, config: ScrapingConfig) -> DOJScraper:
+        """Returns the scraper for the current run, so every node reuses one pooled HTTP session."""
+        if self._scraper is None:
+            self._scraper = DOJScraper(config)
+        return self._scraper
+
+    def _get_fetch_bucket(self, config: ScrapingConfig) -> TokenBucket:
+        """Returns the rate limiter for the current run's concurrent article fetches."""
+        if self._fetch_bucket is None:
+            delay = config.delay_between_requests
+            self._fetch_bucket = TokenBucket(capacity=RATE_LIMIT_BURST, fill_rate=1.0 / delay if delay > 0 else 0.0)
+        return self._fetch_bucket
+
+    def _get_analyzer(self) -> CaseAnalyzer:
+        """Returns the analyzer for the current run, so every batch reuses one instance."""
+        if self._analyzer is None:
+            self._analyzer = CaseAnalyzer()
+        return self._analyzer
+
     def _fetch_urls_node(self, state: ResearchState) -> dict:
         """Fetches press release URLs."""
         logger.info("Fetching press release URLs...")
-        scraper = DOJScraper(state["scraping_config"])
+        scraper = self._get_scraper(state["scraping_config"])
         urls = scraper.get_press_release_urls()
 
         if not urls:
@@ -95,30 +121,43 @@ class ResearchOrchestrator:
         return {"urls_to_process": urls}
 
     def _analyze_url_node(self, state: ResearchState) -> dict:
-        """Analyzes a single URL from the list."""
-        url = state["urls_to_process"].pop(0)
+        """Analyzes the next batch of URLs concurrently."""
+        urls = state["urls_to_process"][:ANALYZE_BATCH_SIZE]
+        del state["urls_to_process"][:ANALYZE_BATCH_SIZE]
+        done = len(state["analyzed_cases"]) + len(state["failed_urls"])
         logger.info(
-            f"Processing URL {len(state['analyzed_cases']) + len(state['failed_urls']) + 1}/{len(state['urls_to_process']) + len(state['analyzed_cases']) + len(state['failed_urls']) + 1}: {url}"
+            f"Processing URLs {done + 1}-{done + len(urls)}/{done + len(urls) + len(state['urls_to_process'])}"
         )
 
-        scraper = DOJScraper(state["scraping_config"])
-        analyzer = CaseAnalyzer()
-
-        try:
-            soup = scraper.fetch_press_release_content(url)
-            if soup:
-                case_info = analyzer.analyze_press_release(url, soup)
-                if case_info:
-                    return {"analyzed_cases": [case_info]}
-                else:
+        # One scraper (and its pooled HTTP session), fetch limiter and analyzer serve the whole run
+        scraper = self._get_scraper(state["scraping_config"])
+        fetch_bucket = self._get_fetch_bucket(state["scraping_config"])
+        analyzer = self._get_analyzer()
+
+        def analyze(url: str) -> Optional[CaseInfo]:
+            try:
+                fetch_bucket.acquire()
+                soup = scraper.fetch_press_release_content(url)
+                if soup:
+                    case_info = analyzer.analyze_press_release(url, soup)
+                    if case_info:
+                        return case_info
                     logger.warning(f"Failed to analyze press release from {url}")
-                    return {"failed_urls": [url]}
-            else:
-                logger.warning(f"Failed to fetch content from {url}")
-                return {"failed_urls": [url]}
-        except Exception as e:
-            logger.error(f"An error occurred while processing {url}: {e}")
-            return {"failed_urls": [url]}
+                else:
+                    logger.warning(f"Failed to fetch content from {url}")
+            except Exception as e:
+                logger.error(f"An error occurred while processing {url}: {e}")
+            return None
+
+        # Fetches are network-bound, so overlapping them in threads hides most of the latency;
+        # fetch_bucket still spaces them by delay_between_requests after a short burst
+        with ThreadPoolExecutor(max_workers=ANALYZE_BATCH_SIZE) as executor:
+            results = list(executor.map(analyze, urls))
+
+        return {
+            "analyzed_cases": [case_info for case_info in results if case_info],
+            "failed_urls": [url for url, case_info in zip(urls, results) if not case_info],
+        }
 
     def _decide_next_step(self, state: ResearchState) -> str:
         """Decides whether to continue processing URLs or finish."""
@@ -236,7 +275,14 @@ class ResearchOrchestrator:
             "pending_feedback": [],
         }
 
-        final_state = self.graph.invoke(initial_state)
+        try:
+            final_state = self.graph.invoke(initial_state)
+        finally:
+            if self._scraper is not None:
+                self._scraper.close()
+                self._scraper = None
+            self._analyzer = None
+            self._fetch_bucket = None
 
         return final_state.get(
             "final_result",
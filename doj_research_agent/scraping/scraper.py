@@ -1,22 +1,103 @@
 """Web scraping functionality for DOJ press releases."""
 
 import logging
+import threading
 import time
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse
 import re
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import warnings
 from bs4 import XMLParsedAsHTMLWarning
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
+from ..analysis.keyword_matcher import KeywordMatcher
 from ..core.models import ScrapingConfig
 from ..core.utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# Listing pages fetched back-to-back before the rate limit kicks in
+RATE_LIMIT_BURST = 5
+# Keep-alive connections kept open per host
+HTTP_POOL_SIZE = 10
+# Transient connection errors and throttling/server errors are retried with backoff
+HTTP_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+# lxml's C parser builds the tree faster than the pure-Python html.parser
+HTML_PARSER = 'lxml'
+# Listing pages are only mined for links, so nothing else needs to be parsed
+LINK_STRAINER = SoupStrainer('a', href=True)
+# XPath equivalents of the _filter_video_content selectors, for the lxml text-only path
+VIDEO_ELEMENTS_XPATH = (
+    './/video'
+    ' | .//iframe[contains(@src, "youtube") or contains(@src, "vimeo") or contains(@src, "dailymotion")'
+    ' or contains(@src, "brightcove") or contains(@src, "jwplayer")]'
+    ' | .//*[contains(@class, "video") or contains(@id, "video")]'
+)
+VIDEO_ONLY_TEXTS = frozenset({
+    'video', 'videos', 'multimedia', 'media player',
+    'play video', 'watch video', 'video player'
+})
+
+# DOJ video pages and video streaming/player hosts, matched against the lowercased URL in one pass
+VIDEO_URL_MATCHER = KeywordMatcher.from_keywords([
+    # Video-related paths
+    '/news/videos', '/video', '/videos', '/media/video', '/media/videos',
+    '/multimedia/video', '/multimedia/videos',
+    # Video flags in the query string
+    '?video=', '&video=',
+    # Streaming and player URLs
+    'youtube.com', 'vimeo.com', 'dailymotion.com', 'brightcove.com', 'jwplayer.com',
+    'video.js', 'player',
+])
+# Video, audio and animated image file extensions
+MEDIA_EXTENSION_RE = re.compile(
+    r'\.(mp4|mov|avi|wmv|flv|webm|mkv|m4v|3gp|ogv|ts|mts|m2ts'
+    r'|mp3|wav|aac|ogg|wma|flac'
+    r'|gif|webp)(\?|$)',
+    re.IGNORECASE
+)
+# Common patterns for DOJ press release URLs
+PRESS_RELEASE_PATHS = ('/pr/', '/press-release/', '/news/', '/opa/pr/')
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing short bursts at an average request rate."""
+    
+    def __init__(self, capacity: int, fill_rate: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            fill_rate: Tokens added per second; 0 or less disables limiting
+        """
+        self.capacity = capacity
+        self.fill_rate = fill_rate
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping only as long as needed for one to refill."""
+        if self.fill_rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.fill_rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
 
 class DOJScraper:
     """Web scraper for DOJ press releases."""
@@ -28,6 +109,12 @@ class DOJScraper:
         self.session.headers.update({
             'User-Agent': config.user_agent
         })
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                              max_retries=HTTP_RETRIES)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        delay = config.delay_between_requests
+        self._bucket = TokenBucket(capacity=RATE_LIMIT_BURST, fill_rate=1.0 / delay if delay > 0 else 0.0)
     
     def get_press_release_urls(self) -> List[str]:
         """
@@ -49,9 +136,6 @@ class DOJScraper:
                 urls.extend(page_urls)
                 logger.info(f"Found {len(page_urls)} press releases on page {page}")
                 
-                # Rate limiting
-                time.sleep(self.config.delay_between_requests)
-                
             except Exception as e:
                 logger.error(f"Error fetching page {page}: {e}")
                 break
@@ -69,10 +153,11 @@ class DOJScraper:
             List of URLs found on the page
         """
         page_url = f"{self.config.base_url}/news?page={page_num}"
+        self._bucket.acquire()  # Rate limiting
         response = self.session.get(page_url, timeout=self.config.timeout)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=LINK_STRAINER)
         
         # Find press release links (adjust selector based on actual DOJ site structure)
         press_releases = soup.find_all('a', href=True)
@@ -98,50 +183,11 @@ class DOJScraper:
         Returns:
             True if URL appears to be a press release
         """
-        # Exclude DOJ video pages and video-related paths
-        video_paths = [
-            '/news/videos',
-            '/video',
-            '/videos',
-            '/media/video',
-            '/media/videos',
-            '/multimedia/video',
-            '/multimedia/videos'
-        ]
-        
-        for video_path in video_paths:
-            if video_path in url.lower():
-                return False
-        
-        # Exclude common video file extensions
-        video_extensions = [
-            r'\.(mp4|mov|avi|wmv|flv|webm|mkv|m4v|3gp|ogv|ts|mts|m2ts)(\?|$)',
-            r'\.(mp3|wav|aac|ogg|wma|flac)(\?|$)',
-            r'\.(gif|webp)(\?|$)'
-        ]
+        # Exclude DOJ video pages, video file formats and video players
+        if VIDEO_URL_MATCHER.contains_any(url.lower()) or MEDIA_EXTENSION_RE.search(url):
+            return False
         
-        for pattern in video_extensions:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False
-        
-        # Exclude video streaming and player URLs
-        video_platforms = [
-            'youtube.com',
-            'vimeo.com',
-            'dailymotion.com',
-            'brightcove.com',
-            'jwplayer.com',
-            'video.js',
-            'player'
-        ]
-        
-        for platform in video_platforms:
-            if platform in url.lower():
-                return False
-        
-        # Common patterns for DOJ press release URLs
-        patterns = ['/pr/', '/press-release/', '/news/', '/opa/pr/']
-        return any(pattern in url for pattern in patterns)
+        return any(pattern in url for pattern in PRESS_RELEASE_PATHS)
     
     def _filter_video_content(self, soup: BeautifulSoup) -> BeautifulSoup:
         """
@@ -198,7 +244,7 @@ class DOJScraper:
             response = self.session.get(url, timeout=self.config.timeout)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Filter out video content if enabled
             if self.config.filter_video_content:
@@ -210,6 +256,43 @@ class DOJScraper:
             logger.error(f"Error fetching content from {url}: {e}")
             return None
     
+    def fetch_press_release_text(self, url: str) -> Optional[str]:
+        """
+        Fetch the article text of a single press release.
+        
+        The page is parsed with lxml directly rather than through BeautifulSoup,
+        which is far cheaper when the caller just needs the text. Video content
+        is removed the same way _filter_video_content does for soups.
+        
+        Args:
+            url: URL of the press release
+            
+        Returns:
+            Whitespace-normalised article text, or None if the fetch fails or
+            the page has no <article>
+        """
+        try:
+            response = self.session.get(url, timeout=self.config.timeout)
+            response.raise_for_status()
+            
+            article = lxml.html.fromstring(response.content).find('.//article')
+            if article is None:
+                return None
+            
+            if self.config.filter_video_content:
+                for element in article.xpath(VIDEO_ELEMENTS_XPATH):
+                    if element is not article:
+                        element.drop_tree()
+                for element in list(article.iter('p', 'div', 'span')):
+                    if element.text_content().strip().lower() in VIDEO_ONLY_TEXTS:
+                        element.drop_tree()
+            
+            return re.sub(r'\s+', ' ', article.text_content()).strip()
+            
+        except Exception as e:
+            logger.error(f"Error fetching content from {url}: {e}")
+            return None
+    
     def extract_indictment_number_from_url(self, url: str) -> str:
         """Fetch a press release and extract the indictment number/details if present."""
         soup = self.fetch_press_release_content(url)
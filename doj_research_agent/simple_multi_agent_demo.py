@@ -148,6 +148,8 @@ class ResearchAgent(SimpleAgent):
     def __init__(self):
         super().__init__("research_agent")
         self.fraud_patterns = ["scheme", "fraud", "deception", "embezzlement", "laundering"]
+        # When set, fraud cases are handed straight to the legal pipeline
+        self.fraud_queue: Optional[asyncio.Queue] = None
     
     async def process_task(self, case_url: str, shared_state: SharedState) -> Dict[str, Any]:
         """Analyze a case for fraud indicators."""
@@ -188,11 +190,15 @@ class ResearchAgent(SimpleAgent):
             })
             
             if fraud_detected:
-                self.send_message(shared_state, "legal_agent", "fraud_case", {
+                fraud_payload = {
                     "case_url": case_url,
                     "case_title": case_title,
                     "confidence": confidence
-                })
+                }
+                if self.fraud_queue is not None:
+                    await self.fraud_queue.put(fraud_payload)
+                else:
+                    self.send_message(shared_state, "legal_agent", "fraud_case", fraud_payload)
             
             self.status = AgentStatus.COMPLETED
             self.update_performance(shared_state, time.time() - start_time, True)
@@ -404,32 +410,37 @@ class SimpleCoordinator:
             await self.evaluation_agent.process_task("periodic_evaluation", shared_state)
     
     async def _run_parallel(self, shared_state: SharedState):
-        """Run agents in parallel where possible."""
+        """Run agents in parallel, pipelining research into legal analysis."""
         print("⚡ Parallel Processing Mode")
         
-        # Create tasks for parallel execution
-        research_tasks = [
-            self.research_agent.process_task(case_url, shared_state)
-            for case_url in shared_state.pending_cases
-        ]
+        # Legal workers consume fraud cases as soon as research finds them
+        fraud_queue: asyncio.Queue = asyncio.Queue()
+        
+        async def legal_worker():
+            while True:
+                fraud_case = await fraud_queue.get()
+                try:
+                    await self.legal_agent.process_task(fraud_case, shared_state)
+                finally:
+                    fraud_queue.task_done()
+        
+        legal_workers = [asyncio.create_task(legal_worker()) for _ in range(2)]
+        self.research_agent.fraud_queue = fraud_queue
+        
+        try:
+            await asyncio.gather(*[
+                self.research_agent.process_task(case_url, shared_state)
+                for case_url in shared_state.pending_cases
+            ])
+            await fraud_queue.join()
+        finally:
+            self.research_agent.fraud_queue = None
+            for worker in legal_workers:
+                worker.cancel()
+            await asyncio.gather(*legal_workers, return_exceptions=True)
         
-        # Execute research tasks in parallel (with limit)
-        batch_size = 3
-        for i in range(0, len(research_tasks), batch_size):
-            batch = research_tasks[i:i + batch_size]
-            await asyncio.gather(*batch)
-            
-            # Parallel legal analysis for completed fraud cases
-            fraud_messages = self.legal_agent.get_messages(shared_state, "fraud_case")
-            if fraud_messages:
-                legal_tasks = [
-                    self.legal_agent.process_task(msg.data, shared_state)
-                    for msg in fraud_messages[-batch_size:]  # Process recent messages
-                ]
-                await asyncio.gather(*legal_tasks)
-            
-            # Evaluation after each batch
-            await self.evaluation_agent.process_task("batch_evaluation", shared_state)
+        # Evaluation once the pipeline has drained
+        await self.evaluation_agent.process_task("batch_evaluation", shared_state)
     
     async def _run_adaptive(self, shared_state: SharedState):
         """Run with adaptive coordination based on performance."""
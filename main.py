@@ -13,10 +13,25 @@ from doj_research_agent import (
     AnalysisResult,
     filter_cases_by_category,
 )
+from doj_research_agent.core.utils import save_to_json
 
 USE_GPT4O = True  # Set to True to use GPT-4o for scraping structured data
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # Or set to your key, or use env var
 
+def _case_to_clean_dict(case):
+    """Return the saved form of a case: drop unused fields, add charge_count and fraud_flag."""
+    d = case.to_dict() if hasattr(case, 'to_dict') else dict(case)
+    # Remove unwanted fields
+    d.pop('location', None)
+    d.pop('case_type', None)
+    d.pop('charge_categories', None)
+    # Add charge_count
+    d['charge_count'] = len(d.get('charges', []))
+    # Add fraud_flag
+    fraud_info = getattr(case, 'fraud_info', None)
+    d['fraud_flag'] = bool(fraud_info.is_fraud) if fraud_info else False
+    return d
+
 def main():
     """Basic usage example."""
     
@@ -98,51 +113,21 @@ def main():
     else:
         output_path = os.path.join(output_dir, f"complete_analysis_{timestamp}.json")
     
-    if USE_GPT4O and cases:
-        # Save with fraud info and charge count, and clean output format
-        def case_to_clean_dict(case):
-            d = case.to_dict() if hasattr(case, 'to_dict') else dict(case)
-            # Remove unwanted fields
-            d.pop('location', None)
-            d.pop('case_type', None)
-            d.pop('charge_categories', None)
-            # Add charge_count
-            d['charge_count'] = len(d.get('charges', []))
-            # Add fraud_flag
-            fraud_info = getattr(case, 'fraud_info', None)
-            d['fraud_flag'] = bool(fraud_info.is_fraud) if fraud_info else False
-            return d
-        with open(output_path, "w") as f:
-            json.dump([case_to_clean_dict(c) for c in cases], f, indent=2)
+    if cases:
+        # Clean every case once; the two modes differ only in how the list is wrapped
+        cleaned_cases = list(map(_case_to_clean_dict, cases))
+        save_to_json(cleaned_cases if USE_GPT4O else {"cases": cleaned_cases}, output_path)
         # Save summary report with matching prefix
         summary_report_path = output_path.replace('.json', '_summary.json')
         summary_report = create_summary_report(cases)
-        with open(summary_report_path, "w") as f:
-            json.dump(summary_report, f, indent=2)
-        print(f"\nGPT-4o results saved: {output_path}")
-        print(f"Summary report saved: {summary_report_path}")
-
-    if not USE_GPT4O and cases:
-        # Save the complete analysis result in cleaned format
-        def case_to_clean_dict(case):
-            d = case.to_dict() if hasattr(case, 'to_dict') else dict(case)
-            d.pop('location', None)
-            d.pop('case_type', None)
-            d.pop('charge_categories', None)
-            d['charge_count'] = len(d.get('charges', []))
-            fraud_info = getattr(case, 'fraud_info', None)
-            d['fraud_flag'] = bool(fraud_info.is_fraud) if fraud_info else False
-            return d
-        cleaned_cases = [case_to_clean_dict(c) for c in cases]
-        with open(output_path, "w") as f:
-            json.dump({"cases": cleaned_cases}, f, indent=2)
-        summary_report_path = output_path.replace('.json', '_summary.json')
-        summary_report = create_summary_report(cases)
-        with open(summary_report_path, "w") as f:
-            json.dump(summary_report, f, indent=2)
-        print(f"\nResults saved:")
-        print(f"  - Complete analysis: {output_path}")
-        print(f"  - Summary report: {summary_report_path}")
+        save_to_json(summary_report, summary_report_path)
+        if USE_GPT4O:
+            print(f"\nGPT-4o results saved: {output_path}")
+            print(f"Summary report saved: {summary_report_path}")
+        else:
+            print(f"\nResults saved:")
+            print(f"  - Complete analysis: {output_path}")
+            print(f"  - Summary report: {summary_report_path}")
     
     return cases
 
@@ -229,8 +214,7 @@ if __name__ == "__main__":
         
         category_results["summary"] = summary_counts
         category_output_path = os.path.join(output_dir, f"category_analysis_{timestamp}.json")
-        with open(category_output_path, "w") as f:
-            json.dump(category_results, f, indent=2)
+        save_to_json(category_results, category_output_path)
         
         print(f"\nCategory analysis results saved: {category_output_path}")
         
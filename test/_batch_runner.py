@@ -0,0 +1,88 @@
+"""Submit offline GPT-4o test prompts through the OpenAI Batch API.
+
+Evaluation scripts are not latency critical, so instead of one live chat
+completion per case they can write every request to a JSONL file, submit it as
+a single batch, and read the results back by ``custom_id`` once it completes.
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import openai
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def run_chat_batch(requests: Iterable[Tuple[str, List[dict]]],
+                   api_key: Optional[str] = None,
+                   model: str = "gpt-4o",
+                   temperature: float = 0.1,
+                   max_tokens: int = 1500,
+                   response_format: Optional[dict] = None,
+                   poll_interval: float = 30.0) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Run chat completion requests as one Batch API job.
+    
+    Args:
+        requests: (custom_id, messages) pairs
+        api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+        model: Model for every request
+        temperature: Sampling temperature for every request
+        max_tokens: Maximum tokens per response
+        response_format: Optional response_format (e.g. a JSON schema) for every request
+        poll_interval: Seconds between batch status checks
+        
+    Yields:
+        (custom_id, message content) pairs; content is None for failed requests
+    """
+    client = openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+        for custom_id, messages in requests:
+            body = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            }
+            if response_format is not None:
+                body["response_format"] = response_format
+            f.write(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }) + "\n")
+        batch_path = f.name
+    
+    try:
+        with open(batch_path, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+    finally:
+        os.remove(batch_path)
+    
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted batch {batch.id}, waiting for results...")
+    while batch.status not in TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+    
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            yield record["custom_id"], None
+            continue
+        yield record["custom_id"], response["body"]["choices"][0]["message"]["content"] or ""
@@ -0,0 +1,23 @@
+"""Write test result files as JSON.
+
+Result files are compact by default; set DEBUG=1 to pretty-print them for
+reading by hand.
+"""
+
+import os
+from typing import Any
+
+from doj_research_agent.core.utils import save_to_json
+
+DEBUG = bool(os.getenv("DEBUG"))
+
+
+def write_json(path: str, obj: Any) -> None:
+    """
+    Serialize obj to path, indented only when DEBUG is set.
+
+    Args:
+        path: Output file path
+        obj: JSON-serializable object
+    """
+    save_to_json(obj, path, indent=2 if DEBUG else None)
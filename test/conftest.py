@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def openai_api_key():
+    """OpenAI API key for the end-to-end GPT-4o tests; skips them when unset."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        pytest.skip("OPENAI_API_KEY environment variable not set")
+    return api_key
+
+
+@pytest.fixture(scope="session")
+def openai_client(openai_api_key):
+    """One OpenAI client per test session (per xdist worker), so its connection pool is reused."""
+    openai = pytest.importorskip("openai")
+    client = openai.OpenAI(api_key=openai_api_key)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """CaseAnalyzer shared by every test in the session."""
+    from doj_research_agent import CaseAnalyzer
+    return CaseAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def categorizer():
+    """ChargeCategorizer shared by every test in the session."""
+    from doj_research_agent import ChargeCategorizer
+    return ChargeCategorizer()
+
+
+@pytest.fixture(scope="session")
+def scraper():
+    """DOJScraper with the default ScrapingConfig, sharing one HTTP session across tests."""
+    from doj_research_agent.core.models import ScrapingConfig
+    from doj_research_agent.scraping.scraper import DOJScraper
+    with DOJScraper(ScrapingConfig()) as scraper:
+        yield scraper
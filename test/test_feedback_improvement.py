@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
 """Test script for feedback-based model improvement."""
 
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from doj_research_agent.core.feedback_manager import FeedbackManager
 from doj_research_agent.core.feedback_improver import FeedbackBasedImprover
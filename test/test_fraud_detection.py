@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """Test script to demonstrate enhanced fraud detection capabilities."""
 
+import contextlib
+import io
+import sys
+
 from doj_research_agent import CaseAnalyzer, ChargeCategorizer
 from doj_research_agent.models import ChargeCategory, CaseFraudInfo
 
-def test_fraud_detection():
+def test_fraud_detection(analyzer, categorizer):
     """Test the enhanced fraud detection with various fraud-related content."""
     
-    analyzer = CaseAnalyzer()
-    categorizer = ChargeCategorizer()
-    
     # Test cases with different types of fraud
     test_cases = [
         {
@@ -67,34 +68,37 @@ def test_fraud_detection():
     print("Testing Enhanced Fraud Detection Capabilities")
     print("=" * 60)
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\nTest Case {i}: {test_case['title']}")
-        print("-" * 40)
-        
-        # Test charge categorization
-        charges = ["wire fraud", "money laundering"]  # Sample charges
-        categories = categorizer.categorize_charges(charges, test_case['content'])
-        
-        # Test fraud detection
-        fraud_info = analyzer._is_fraud_case(categories, test_case['content'])
-        
-        print(f"Content: {test_case['content'][:100]}...")
-        print(f"Categories: {[cat.value for cat in categories]}")
-        print(f"Fraud Detected: {fraud_info.is_fraud}")
-        print(f"Expected Fraud: {test_case['expected_fraud']}")
-        print(f"Match: {'✓' if fraud_info.is_fraud == test_case['expected_fraud'] else '✗'}")
-        
-        if fraud_info.evidence:
-            print(f"Evidence: {fraud_info.evidence}")
+    # Collect per-case output and write it once, so parallel test output stays coherent
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        for i, test_case in enumerate(test_cases, 1):
+            print(f"\nTest Case {i}: {test_case['title']}")
+            print("-" * 40)
+            
+            # Test charge categorization
+            charges = ["wire fraud", "money laundering"]  # Sample charges
+            categories = categorizer.categorize_charges(charges, test_case['content'])
+            
+            # Test fraud detection
+            fraud_info = analyzer._is_fraud_case(categories, test_case['content'])
+            
+            print(f"Content: {test_case['content'][:100]}...")
+            print(f"Categories: {[cat.value for cat in categories]}")
+            print(f"Fraud Detected: {fraud_info.is_fraud}")
+            print(f"Expected Fraud: {test_case['expected_fraud']}")
+            print(f"Match: {'✓' if fraud_info.is_fraud == test_case['expected_fraud'] else '✗'}")
+            
+            if fraud_info.evidence:
+                print(f"Evidence: {fraud_info.evidence}")
+    
+    sys.stdout.write(buf.getvalue())
     
     print(f"\n{'=' * 60}")
     print("Fraud Detection Test Complete!")
 
-def test_fraud_keywords():
+def test_fraud_keywords(categorizer):
     """Test specific fraud keywords and synonyms."""
     
-    categorizer = ChargeCategorizer()
-    
     # Test various fraud-related terms
     fraud_terms = [
         "ponzi scheme", "embezzlement", "money laundering", "medicare fraud",
@@ -106,15 +110,19 @@ def test_fraud_keywords():
     print("\nTesting Fraud Keywords and Categories")
     print("=" * 50)
     
-    for term in fraud_terms:
-        categories = categorizer.categorize_charge(term)
-        fraud_categories = [cat for cat in categories if 'fraud' in cat.value or cat.value in ['tax', 'public_corruption', 'cybercrime', 'consumer_protection']]
-        
-        print(f"Term: '{term}'")
-        print(f"  Categories: {[cat.value for cat in categories]}")
-        print(f"  Fraud-related: {[cat.value for cat in fraud_categories]}")
-        print()
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        for term in fraud_terms:
+            categories = categorizer.categorize_charge(term)
+            fraud_categories = [cat for cat in categories if 'fraud' in cat.value or cat.value in ['tax', 'public_corruption', 'cybercrime', 'consumer_protection']]
+            
+            print(f"Term: '{term}'")
+            print(f"  Categories: {[cat.value for cat in categories]}")
+            print(f"  Fraud-related: {[cat.value for cat in fraud_categories]}")
+            print()
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
-    test_fraud_detection()
-    test_fraud_keywords() 
\ No newline at end of file
+    categorizer = ChargeCategorizer()
+    test_fraud_detection(CaseAnalyzer(), categorizer)
+    test_fraud_keywords(categorizer) 
\ No newline at end of file
@@ -4,9 +4,9 @@ Test GPT-4o and classic fraud logic consistency for a known problematic use case
 """
 
 import os
-from doj_research_agent.analyzer import CaseAnalyzer
+from doj_research_agent import CaseAnalyzer
 
-def main():
+def test_gpt4o_consistency(analyzer, openai_client):
     # Example problematic content (telemarketing scheme, consumer fraud)
     content = (
         "Costa Rica Resident Sentenced for Orchestrating Multimillion-Dollar International Telemarketing Scheme. "
@@ -15,13 +15,9 @@ def main():
     )
     print("Testing GPT-4o and classic fraud logic on telemarketing scheme use case...")
     print("=" * 80)
-    analyzer = CaseAnalyzer()
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("ERROR: OPENAI_API_KEY environment variable not set")
-        return
     # Run GPT-4o extraction (with consistency post-processing)
-    result = analyzer.extract_structured_info_gpt4o(content, api_key)
+    result = analyzer.extract_structured_info_gpt4o(content, openai_client.api_key,
+                                                    client=openai_client)
     print("\nGPT-4o + Consistency Results:")
     print("-" * 40)
     for key, value in result.items():
@@ -36,4 +32,9 @@ def main():
     print("\nTest complete.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("ERROR: OPENAI_API_KEY environment variable not set")
+    else:
+        import openai
+        test_gpt4o_consistency(CaseAnalyzer(), openai.OpenAI(api_key=api_key))
\ No newline at end of file
@@ -5,7 +5,7 @@ Test the merged classic + GPT-4o extraction for a real DOJ press release URL.
 
 import os
 from doj_research_agent.scraper import DOJScraper, ScrapingConfig
-import json
+from test._json_output import write_json
 
 def main():
     url = "https://www.justice.gov/opa/pr/seattle-businessman-convicted-tax-evasion-and-filing-false-tax-returns"
@@ -28,8 +28,7 @@ def main():
     # Save output for inspection
     import datetime
     output_file = f"output/test_gpt4o_scraper_merge_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=2)
+    write_json(output_file, result)
     print(f"\nResults saved to: {output_file}")
 
 if __name__ == "__main__":
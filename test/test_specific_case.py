@@ -4,10 +4,10 @@ Test script to analyze a specific DOJ press release for fraud detection.
 """
 
 import os
-import json
 from datetime import datetime
 from doj_research_agent.scraper import DOJScraper, ScrapingConfig
 from doj_research_agent.analyzer import CaseAnalyzer
+from test._json_output import write_json
 
 def test_specific_case():
     """Test fraud detection on a specific DOJ press release."""
@@ -73,12 +73,11 @@ def test_specific_case():
         os.makedirs(output_dir, exist_ok=True)
         
         output_file = os.path.join(output_dir, f"specific_case_analysis_{timestamp}.json")
-        with open(output_file, "w") as f:
-            json.dump({
-                "url": test_url,
-                "gpt4o_analysis": result,
-                "fraud_info": fraud_info
-            }, f, indent=2)
+        write_json(output_file, {
+            "url": test_url,
+            "gpt4o_analysis": result,
+            "fraud_info": fraud_info
+        })
         
         print(f"\nResults saved to: {output_file}")
         
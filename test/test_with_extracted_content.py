@@ -4,10 +4,10 @@ Test GPT-4o analysis with properly extracted article content.
 """
 
 import os
-import json
 from datetime import datetime
-from doj_research_agent.scraper import DOJScraper, ScrapingConfig
-from doj_research_agent.analyzer import CaseAnalyzer
+from doj_research_agent import CaseAnalyzer, DOJScraper
+from doj_research_agent.core.models import ScrapingConfig
+from test._json_output import write_json
 
 def test_with_extracted_content():
     """Test fraud detection with properly extracted content."""
@@ -27,23 +27,9 @@ def test_with_extracted_content():
     print("=" * 80)
     
     try:
-        # Fetch the page content
-        soup = scraper.fetch_press_release_content(test_url)
-        
-        if not soup:
-            print("Failed to fetch content")
-            return
-        
-        # Extract the actual article content
-        article = soup.find('article')
-        if article:
-            # Get the text content from the article
-            article_text = article.get_text().strip()
-            
-            # Clean up the text (remove extra whitespace, etc.)
-            import re
-            article_text = re.sub(r'\s+', ' ', article_text)
-            
+        # Fetch only the article text, whitespace already normalised
+        article_text = scraper.fetch_press_release_text(test_url)
+        if article_text:
             print("Extracted Article Content:")
             print("-" * 40)
             print(article_text[:1000] + "..." if len(article_text) > 1000 else article_text)
@@ -76,17 +62,16 @@ def test_with_extracted_content():
             os.makedirs(output_dir, exist_ok=True)
             
             output_file = os.path.join(output_dir, f"extracted_content_analysis_{timestamp}.json")
-            with open(output_file, "w") as f:
-                json.dump({
-                    "url": test_url,
-                    "extracted_content": article_text,
-                    "gpt4o_analysis": result
-                }, f, indent=2)
+            write_json(output_file, {
+                "url": test_url,
+                "extracted_content": article_text,
+                "gpt4o_analysis": result
+            })
             
             print(f"\nResults saved to: {output_file}")
             
         else:
-            print("No article tag found")
+            print("Failed to fetch content or no article tag found")
             
     except Exception as e:
         print(f"Error: {e}")
@@ -10,9 +10,12 @@ from doj_research_agent.analyzer import CaseAnalyzer
 from doj_research_agent.models import CaseType, ChargeCategory
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_soup():
-    """Fixture to create a mock BeautifulSoup object for a press release."""
+    """Mock BeautifulSoup object for a press release, parsed once per module.
+
+    CaseAnalyzer only reads the soup; a test that mutates it must work on copy.copy(mock_soup).
+    """
     html = """
     <html>
         <head>
@@ -3,50 +3,79 @@ Tests for the ResearchOrchestrator to ensure the graph can be generated and exec
 """
 
 import pytest
-from unittest.mock import MagicMock
+from bs4 import BeautifulSoup
 
 from doj_research_agent.orchestrator import ResearchOrchestrator
 from doj_research_agent.models import CaseInfo, CaseType
 from doj_research_agent.evaluate import EvaluationResult
 
 
+# Parsed once, like the soup DOJScraper.fetch_press_release_content returns
+_MOCK_SOUP = BeautifulSoup("<html><body>Mock content</body></html>", "lxml")
+
+
+class _StubScraper:
+    """Plain stand-in for DOJScraper returning two fixed press releases."""
+
+    def get_press_release_urls(self, *args, **kwargs):
+        return ["http://example.com/pr1", "http://example.com/pr2"]
+
+    def fetch_press_release_content(self, *args, **kwargs):
+        return _MOCK_SOUP
+
+    def close(self):
+        pass
+
+
+class _StubAnalyzer:
+    """Plain stand-in for CaseAnalyzer returning the same case for every URL."""
+
+    def analyze_press_release(self, *args, **kwargs):
+        return CaseInfo(
+            title="Mock Case",
+            date="2025-07-21",
+            url="http://example.com/pr1",
+            case_type=CaseType.CRIMINAL,
+        )
+
+
+class _StubEvaluator:
+    """Plain stand-in for FraudDetectionEvaluator reporting perfect scores."""
+
+    def evaluate_dataset(self, *args, **kwargs):
+        return EvaluationResult(
+            accuracy=1.0, precision=1.0, recall=1.0, f1_score=1.0, confusion_matrix=[[1, 0], [0, 1]], detailed_results=[]
+        )
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    """One orchestrator per module; components are created lazily at run time, so patches still apply."""
+    return ResearchOrchestrator()
+
+
 @pytest.fixture
-def mock_scraper(mocker):
-    """Fixture to mock the DOJScraper."""
-    mock = MagicMock()
-    mock.get_press_release_urls.return_value = ["http://example.com/pr1", "http://example.com/pr2"]
-    mock.fetch_press_release_content.return_value = "<html><body>Mock content</body></html>"
-    return mock
+def mock_scraper():
+    """Fixture to stub the DOJScraper."""
+    return _StubScraper()
 
 
 @pytest.fixture
-def mock_analyzer(mocker):
-    """Fixture to mock the CaseAnalyzer."""
-    mock = MagicMock()
-    mock.analyze_press_release.return_value = CaseInfo(
-        title="Mock Case",
-        date="2025-07-21",
-        url="http://example.com/pr1",
-        case_type=CaseType.CRIMINAL,
-    )
-    return mock
+def mock_analyzer():
+    """Fixture to stub the CaseAnalyzer."""
+    return _StubAnalyzer()
 
 
 @pytest.fixture
-def mock_evaluator(mocker):
-    """Fixture to mock the FraudDetectionEvaluator."""
-    mock = MagicMock()
-    mock.evaluate_dataset.return_value = EvaluationResult(
-        accuracy=1.0, precision=1.0, recall=1.0, f1_score=1.0, confusion_matrix=[[1, 0], [0, 1]], detailed_results=[]
-    )
-    return mock
+def mock_evaluator():
+    """Fixture to stub the FraudDetectionEvaluator."""
+    return _StubEvaluator()
 
 
-def test_generate_graph_definition():
+def test_generate_graph_definition(orchestrator):
     """
     Tests that the orchestrator's graph can be generated and visualized.
     """
-    orchestrator = ResearchOrchestrator()
     mermaid_definition = orchestrator.graph.get_graph().draw_mermaid()
 
     print("--- Mermaid Graph Definition ---")
@@ -63,7 +92,7 @@ def test_generate_graph_definition():
     assert "compile_results --> evaluate_results" in mermaid_definition
 
 
-def test_orchestrator_run(mocker, mock_scraper, mock_analyzer, mock_evaluator):
+def test_orchestrator_run(orchestrator, mocker, mock_scraper, mock_analyzer, mock_evaluator):
     """
     Tests the full execution of the orchestrator with mocked components.
     """
@@ -71,7 +100,6 @@ def test_orchestrator_run(mocker, mock_scraper, mock_analyzer, mock_evaluator):
     mocker.patch("doj_research_agent.orchestrator.CaseAnalyzer", return_value=mock_analyzer)
     mocker.patch("doj_research_agent.orchestrator.FraudDetectionEvaluator", return_value=mock_evaluator)
 
-    orchestrator = ResearchOrchestrator()
     result = orchestrator.run(max_cases=2)
 
     assert result.total_cases == 2
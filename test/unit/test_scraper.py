@@ -0,0 +1,39 @@
+"""
+Tests for the DOJScraper class.
+"""
+
+import re
+from unittest.mock import Mock
+
+from bs4 import BeautifulSoup
+
+from doj_research_agent.core.models import ScrapingConfig
+from doj_research_agent.scraping.scraper import DOJScraper
+
+
+ARTICLE_HTML = b"""
+<html>
+    <body>
+        <article>
+            <h1>Man Sentenced</h1>
+            <p>Defendant <a href="/people/john">John</a>'s wire-<em>fraud</em>
+               scheme   ran <strong>for years</strong>.</p>
+            <div class="video-player">Watch the video</div>
+        </article>
+    </body>
+</html>
+"""
+
+
+def test_fetch_press_release_text_keeps_inline_markup_text_intact():
+    """Text across inline tags is joined like BeautifulSoup's get_text, without extra spaces."""
+    scraper = DOJScraper(ScrapingConfig())
+    scraper.session.get = Mock(return_value=Mock(content=ARTICLE_HTML, raise_for_status=Mock()))
+
+    text = scraper.fetch_press_release_text("https://www.justice.gov/opa/pr/test")
+
+    assert text == "Man Sentenced Defendant John's wire-fraud scheme ran for years."
+
+    # Same text the BeautifulSoup path produces for the same page
+    soup = scraper._filter_video_content(BeautifulSoup(ARTICLE_HTML, "lxml"))
+    assert text == re.sub(r'\s+', ' ', soup.find('article').get_text().strip())